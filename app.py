@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+import html
 import importlib.util
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
 import streamlit as st
+from scipy.spatial import cKDTree
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 import data_loader
 import models
 from config.sport_config import SportConfig
+from services.shared.base_data_loader import BaseDataLoader
 from services.shared.data_loader_factory import DataLoaderFactory
 from styles.glassmorphism import get_glassmorphism_css
-from utils import format_season_label, safe_mean
+from utils import (
+    days_since,
+    downcast_numeric,
+    ensure_datetime,
+    format_season_label,
+    safe_mean,
+    sort_by_date,
+)
 
 
 st.set_page_config(
@@ -35,60 +49,265 @@ import plotly.express as px
 import plotly.graph_objects as go
 
 
+def render_metric_grid(metrics: list[tuple]) -> None:
+    """Render a row of metric cards, each (label, value[, delta]), as one markdown element."""
+    cards = []
+    for label, value, *delta in metrics:
+        delta_html = (
+            f"<div class='metric-delta'>{html.escape(str(delta[0]))}</div>" if delta else ""
+        )
+        cards.append(
+            f"<div class='metric-card'><div class='metric-label'>{html.escape(str(label))}</div>"
+            f"<div class='metric-value'>{html.escape(str(value))}</div>{delta_html}</div>"
+        )
+    st.markdown(f"<div class='metric-grid'>{''.join(cards)}</div>", unsafe_allow_html=True)
+
+
+# Game log columns read by the metrics, prop validator, and charts
+PLAYER_LOG_COLUMNS = ("GAME_DATE", "PTS", "AST", "REB", "MIN", "IS_HOME")
+
+# League stat columns used by the advanced and comparisons tabs
+LEAGUE_FEATURES = ("Points", "Assists", "Rebounds", "UsageRate", "TrueShootingPct")
+
+
 # Initialize session state for sport selection
 if "sport" not in st.session_state:
     st.session_state.sport = "NBA"
 
 
-@st.cache_data(ttl=3600)
+@st.cache_resource
+def get_sport_configs() -> dict[str, Mapping]:
+    """Return the configuration for every available sport, built once per process."""
+    return {s: SportConfig.get_sport_config(s) for s in SportConfig.get_available_sports()}
+
+
+@st.cache_resource
+def get_loader(sport: str) -> BaseDataLoader:
+    """Return the shared data loader instance for the specified sport."""
+    return DataLoaderFactory.create_loader(sport)
+
+
+@st.cache_data(ttl=3600, max_entries=8)
 def load_active_players(sport: str) -> pd.DataFrame:
     """Load active players for the specified sport."""
     if sport == "NBA":
         return data_loader.list_active_players()
     else:
         # For NHL and other sports, use the data loader factory
-        loader = DataLoaderFactory.create_loader(sport)
+        loader = get_loader(sport)
         return loader.list_active_players()
 
 
-@st.cache_data(ttl=3600)
+@st.cache_data(ttl=3600, max_entries=8)
 def load_active_teams(sport: str) -> pd.DataFrame:
     """Load active teams for the specified sport."""
     if sport == "NBA":
         return data_loader.list_active_teams()
     else:
-        loader = DataLoaderFactory.create_loader(sport)
+        loader = get_loader(sport)
         return loader.list_active_teams()
 
 
-@st.cache_data(ttl=1800)
+@st.cache_data(ttl=3600, max_entries=8)
+def load_player_ids(sport: str) -> dict[str, int]:
+    """Map active player names to IDs so lookups skip a roster scan."""
+    players_df = load_active_players(sport)
+    if players_df.empty:
+        return {}
+    return dict(zip(players_df["full_name"], players_df["id"].astype(int).tolist()))
+
+
+@st.cache_data(ttl=3600, max_entries=8)
+def load_team_ids(sport: str) -> dict[str, int]:
+    """Map team names to IDs so lookups skip a team list scan."""
+    teams_df = load_active_teams(sport)
+    if teams_df.empty:
+        return {}
+    return dict(zip(teams_df["full_name"], teams_df["id"].astype(int).tolist()))
+
+
+@st.cache_data(ttl=3600, max_entries=8)
+def load_player_names(sport: str) -> list[str]:
+    """Return sorted active player names for the sidebar dropdown."""
+    return sorted(load_player_ids(sport))
+
+
+@st.cache_data(ttl=3600, max_entries=8)
+def load_team_names(sport: str) -> list[str]:
+    """Return sorted team names for the sidebar dropdown."""
+    return sorted(load_team_ids(sport))
+
+
+@st.cache_data(ttl=1800, max_entries=32, show_spinner=False)
 def load_league_stats(sport: str, season: str) -> pd.DataFrame:
     """Load league stats for the specified sport."""
     if sport == "NBA":
-        return data_loader.load_league_player_stats(season=season)
+        df = data_loader.load_league_player_stats(season=season)
     else:
-        loader = DataLoaderFactory.create_loader(sport)
-        return loader.load_league_player_stats(season=season)
-
-
-@st.cache_data(ttl=900)
-def load_player_log(sport: str, player_id: int, season: str) -> pd.DataFrame:
-    """Load player game log for the specified sport."""
+        loader = get_loader(sport)
+        df = loader.load_league_player_stats(season=season)
+    # Guarantee the feature columns once per cache miss rather than on every rerun
+    df = df.reindex(columns=df.columns.union(LEAGUE_FEATURES, sort=False), fill_value=0.0)
+    return downcast_numeric(df)
+
+
+@st.cache_data(ttl=900, max_entries=256, show_spinner=False)
+def load_player_log(
+    sport: str,
+    player_id: int,
+    season: str,
+    cols: tuple[str, ...] = PLAYER_LOG_COLUMNS,
+) -> pd.DataFrame:
+    """Load player game log for the specified sport, sorted by game date.
+
+    Only ``cols`` are kept so the cached frame holds what the dashboard reads.
+    """
     if sport == "NBA":
-        return data_loader.load_player_game_log(player_id=player_id, season=season)
+        df = data_loader.load_player_game_log(player_id=player_id, season=season)
     else:
-        loader = DataLoaderFactory.create_loader(sport)
-        return loader.load_player_game_log(player_id=player_id, season=season)
+        loader = get_loader(sport)
+        df = loader.load_player_game_log(player_id=player_id, season=season)
+    df = df[[col for col in cols if col in df.columns]]
+    if "GAME_DATE" in df.columns:
+        df = df.assign(GAME_DATE=ensure_datetime(df["GAME_DATE"]))
+        df = sort_by_date(df).reset_index(drop=True)
+    return downcast_numeric(df)
 
 
-@st.cache_data(ttl=900)
+@st.cache_data(ttl=900, max_entries=256, show_spinner=False)
 def load_team_log(sport: str, team_id: int, season: str) -> pd.DataFrame:
-    """Load team game log for the specified sport."""
+    """Load team game log for the specified sport, sorted by game date."""
     if sport == "NBA":
-        return data_loader.load_team_game_log(team_id=team_id, season=season)
+        df = data_loader.load_team_game_log(team_id=team_id, season=season)
     else:
-        loader = DataLoaderFactory.create_loader(sport)
-        return loader.load_team_game_log(team_id=team_id, season=season)
+        loader = get_loader(sport)
+        df = loader.load_team_game_log(team_id=team_id, season=season)
+    if "GAME_DATE" in df.columns:
+        df["GAME_DATE"] = ensure_datetime(df["GAME_DATE"])
+        df = sort_by_date(df).reset_index(drop=True)
+    return df
+
+
+@st.cache_data(ttl=900, max_entries=128)
+def compute_prop_validator(sport: str, player_id: int, season: str) -> pd.DataFrame:
+    """Build the points prop validator table for a player's season."""
+    return models.build_prop_validator(load_player_log(sport, player_id, season), stat_col="PTS")
+
+
+@st.cache_resource(ttl=1800, max_entries=32)
+def get_comp_index(
+    sport: str, season: str, feature_cols: tuple[str, ...]
+) -> tuple[pd.DataFrame, cKDTree]:
+    """Return the league frame and a KD-tree over its standardized features, shared across sessions.
+
+    The tree is positional, so it is cached together with the exact frame it was built from.
+    """
+    stats = load_league_stats(sport, season)
+    return stats, cKDTree(models.build_feature_matrix(stats, list(feature_cols)))
+
+
+@st.cache_data(ttl=900, max_entries=128)
+def compute_player_comps(
+    sport: str,
+    season: str,
+    player_name: str,
+    feature_cols: tuple[str, ...],
+) -> pd.DataFrame:
+    """Find similar players for the specified player and feature set."""
+    stats, comp_index = get_comp_index(sport, season, feature_cols)
+    return models.find_player_comps(stats, player_name, list(feature_cols), comp_index=comp_index)
+
+
+@st.cache_data(ttl=900, max_entries=128)
+def compute_home_away_means(sport: str, player_id: int, season: str) -> pd.DataFrame:
+    """Return a player's home and away stat means indexed by IS_HOME."""
+    player_log = load_player_log(sport, player_id, season)
+    if player_log.empty or "IS_HOME" not in player_log.columns:
+        return pd.DataFrame()
+    return player_log.groupby("IS_HOME")[["PTS", "AST", "REB"]].mean()
+
+
+@st.cache_data(ttl=1800, max_entries=32)
+def compute_league_averages(sport: str, season: str, feature_cols: tuple[str, ...]) -> pd.Series:
+    """Return league-average values for the specified feature set."""
+    return load_league_stats(sport, season)[list(feature_cols)].mean(numeric_only=True)
+
+
+@st.cache_resource(max_entries=1001)
+def build_fatigue_gauge(fatigue_score: float) -> go.Figure:
+    """Build the fatigue gauge figure for a score rounded to one decimal."""
+    gauge = go.Figure(
+        go.Indicator(
+            mode="gauge+number",
+            value=fatigue_score,
+            number={"font": {"color": "#FAFAFA"}},
+            gauge={
+                "axis": {"range": [0, 100]},
+                "bar": {"color": "#FF4B4B"},
+                "steps": [
+                    {"range": [0, 40], "color": "#00FFAA"},
+                    {"range": [40, 70], "color": "#FFD166"},
+                    {"range": [70, 100], "color": "#FF4B4B"},
+                ],
+            },
+        )
+    )
+    gauge.update_layout(height=260, margin=dict(l=20, r=20, t=20, b=20), paper_bgcolor="#0E1117")
+    return gauge
+
+
+# Chart figures are cached as shared resources; st.plotly_chart only serializes them
+@st.cache_resource(ttl=900, max_entries=128)
+def build_trend_figures(
+    sport: str, player_id: int, season: str, player_name: str
+) -> tuple[go.Figure, go.Figure, go.Figure]:
+    """Build the trends tab charts (trend, multi-stat, distribution) for a player log."""
+    from components.shared.visualizations import (
+        create_performance_trend_chart,
+        create_distribution_chart,
+        create_multi_stat_comparison,
+    )
+
+    player_log = load_player_log(sport, player_id, season)
+    return (
+        create_performance_trend_chart(player_log, "PTS", player_name, sport, show_rolling_avg=True),
+        create_multi_stat_comparison(player_log, ["PTS", "AST", "REB", "MIN"], player_name, sport),
+        create_distribution_chart(player_log, "PTS", player_name, sport),
+    )
+
+
+@st.cache_resource(ttl=900, max_entries=128)
+def build_home_away_figure(sport: str, player_id: int, season: str, player_name: str) -> go.Figure:
+    """Build the home vs away comparison chart for a player log."""
+    from components.shared.visualizations import create_home_away_comparison
+
+    return create_home_away_comparison(
+        load_player_log(sport, player_id, season),
+        ["PTS", "AST", "REB"],
+        player_name,
+        sport,
+        venue_means=compute_home_away_means(sport, player_id, season),
+    )
+
+
+@st.cache_resource(ttl=1800, max_entries=128)
+def build_radar_figure(
+    player_values: tuple[float, ...],
+    league_values: tuple[float, ...],
+    feature_cols: tuple[str, ...],
+    player_name: str,
+    sport: str,
+) -> go.Figure:
+    """Build the player vs league radar chart for a set of feature values."""
+    from components.shared.visualizations import create_enhanced_radar_chart
+
+    return create_enhanced_radar_chart(
+        np.array(player_values),
+        np.array(league_values),
+        list(feature_cols),
+        player_name,
+        sport,
+    )
 
 
 
@@ -97,7 +316,8 @@ with st.sidebar:
     st.markdown("## 🏆 Sport Selection")
     
     # Sport selector with improved UI
-    available_sports = SportConfig.get_available_sports()
+    sport_configs = get_sport_configs()
+    available_sports = list(sport_configs)
     sport_labels = {
         "NBA": "🏀 NBA Basketball",
         "NHL": "🏒 NHL Hockey"
@@ -115,7 +335,7 @@ with st.sidebar:
     st.session_state.sport = sport
     
     # Get sport-specific configuration
-    sport_config = SportConfig.get_sport_config(sport)
+    sport_config = sport_configs[sport]
     
     st.markdown("---")
     st.markdown("## 📊 League Settings")
@@ -125,26 +345,26 @@ with st.sidebar:
     season = st.selectbox("Season", seasons, index=0, format_func=format_season_label)
 
     # Load teams for selected sport
-    teams_df = load_active_teams(sport)
-    if teams_df.empty:
+    team_names = load_team_names(sport)
+    if not team_names:
         st.error(f"Unable to load {sport} teams. Please check your connectivity.")
         st.stop()
-    team_name = st.selectbox("Team", teams_df["full_name"].sort_values().tolist())
+    team_name = st.selectbox("Team", team_names)
 
     # Load players for selected sport
-    players_df = load_active_players(sport)
+    player_names = load_player_names(sport)
     
     # For NHL, show a message about player data
-    if sport == "NHL" and players_df.empty:
+    if sport == "NHL" and not player_names:
         st.info("🚧 NHL player data is being loaded. Currently showing teams only.")
         st.markdown("*Full NHL player integration coming soon*")
         # Create a dummy player for demo purposes
         player_name = "Demo Player"
     else:
-        if players_df.empty:
+        if not player_names:
             st.error(f"Unable to load {sport} players. Please check your connectivity.")
             st.stop()
-        player_name = st.selectbox("Player", players_df["full_name"].sort_values().tolist())
+        player_name = st.selectbox("Player", player_names)
 
 
 # Apply glassmorphism CSS based on selected sport
@@ -166,15 +386,9 @@ st.markdown(
 )
 
 
-# Get player and team IDs (NBA only for now, NHL will be implemented)
-if sport == "NBA":
-    player_id = data_loader.get_player_id(player_name)
-    team_id = data_loader.get_team_id(team_name)
-else:  # NHL
-    # For demo purposes, use placeholder
-    player_id = None
-    loader = DataLoaderFactory.create_loader(sport)
-    team_id = loader.get_team_id(team_name)
+# Get player and team IDs (player IDs are NBA only for now, NHL will be implemented)
+team_id = load_team_ids(sport).get(team_name)
+player_id = load_player_ids(sport).get(player_name) if sport == "NBA" else None
 
 
 # Skip detailed analytics for NHL demo (data integration in progress)
@@ -213,15 +427,14 @@ if sport == "NHL":
     
     # Show team info for NHL
     st.markdown(f"### 🏒 {team_name}")
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Team ID", team_id if team_id else "N/A")
-    with col2:
-        st.metric("Season", season)
-    with col3:
-        st.metric("League", "NHL")
-    with col4:
-        st.metric("Teams", "32")
+    render_metric_grid(
+        [
+            ("Team ID", team_id if team_id else "N/A"),
+            ("Season", season),
+            ("League", "NHL"),
+            ("Teams", "32"),
+        ]
+    )
     
     st.markdown("---")
     st.caption("Signal Sports Analytics • Multi-Sport Platform • NHL Integration in Progress")
@@ -234,29 +447,34 @@ if player_id is None:
     st.stop()
 
 with st.spinner("Loading player analytics..."):
-    player_log = load_player_log(sport, player_id, season)
+    # The three fetches are independent API calls, so overlap them on a cold cache.
+    # Workers attach the script context so the cached loaders behave as on the main thread.
+    with ThreadPoolExecutor(
+        max_workers=3, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())
+    ) as pool:
+        player_future = pool.submit(load_player_log, sport, player_id, season)
+        league_future = pool.submit(load_league_stats, sport, season)
+        team_future = (
+            pool.submit(load_team_log, sport, team_id, season) if team_id is not None else None
+        )
+        player_log = player_future.result()
+        league_stats = league_future.result()
+        team_log = team_future.result() if team_future is not None else pd.DataFrame()
 if player_log.empty:
     st.warning("No game log data available for this player/season.")
 
-league_stats = load_league_stats(sport, season)
-
-team_log = pd.DataFrame()
-if team_id is not None:
-    team_log = load_team_log(sport, team_id, season)
+feature_cols = list(LEAGUE_FEATURES)
 
 
 # Enhanced metric cards with animation
 st.markdown("<div class='section-header'>📈 Performance Metrics</div>", unsafe_allow_html=True)
-metrics_cols = st.columns(4)
 if not player_log.empty:
-    points_avg = safe_mean(player_log["PTS"])
-    assists_avg = safe_mean(player_log["AST"])
-    rebounds_avg = safe_mean(player_log["REB"])
-    minutes_avg = safe_mean(player_log["MIN"])
-    recent_points = safe_mean(player_log.sort_values("GAME_DATE").tail(5)["PTS"])
-    recent_assists = safe_mean(player_log.sort_values("GAME_DATE").tail(5)["AST"])
-    recent_rebounds = safe_mean(player_log.sort_values("GAME_DATE").tail(5)["REB"])
-    recent_minutes = safe_mean(player_log.sort_values("GAME_DATE").tail(5)["MIN"])
+    # Season and last-5 means are two strided reductions over one float64 block
+    kpi_matrix = player_log[["PTS", "AST", "REB", "MIN"]].to_numpy(dtype="float64", na_value=np.nan)
+    points_avg, assists_avg, rebounds_avg, minutes_avg = map(float, np.nanmean(kpi_matrix, axis=0))
+    recent_points, recent_assists, recent_rebounds, recent_minutes = map(
+        float, np.nanmean(kpi_matrix[-5:], axis=0)
+    )
     points_delta = f"{recent_points - points_avg:+.1f}"
     assists_delta = f"{recent_assists - assists_avg:+.1f}"
     rebounds_delta = f"{recent_rebounds - rebounds_avg:+.1f}"
@@ -265,10 +483,14 @@ else:
     points_avg = assists_avg = rebounds_avg = minutes_avg = 0.0
     points_delta = assists_delta = rebounds_delta = minutes_delta = "+0.0"
 
-metrics_cols[0].metric("Points", f"{points_avg:.1f}", points_delta)
-metrics_cols[1].metric("Assists", f"{assists_avg:.1f}", assists_delta)
-metrics_cols[2].metric("Rebounds", f"{rebounds_avg:.1f}", rebounds_delta)
-metrics_cols[3].metric("Minutes", f"{minutes_avg:.1f}", minutes_delta)
+render_metric_grid(
+    [
+        ("Points", f"{points_avg:.1f}", points_delta),
+        ("Assists", f"{assists_avg:.1f}", assists_delta),
+        ("Rebounds", f"{rebounds_avg:.1f}", rebounds_delta),
+        ("Minutes", f"{minutes_avg:.1f}", minutes_delta),
+    ]
+)
 
 
 left_col, right_col = st.columns([1.1, 1])
@@ -276,19 +498,13 @@ left_col, right_col = st.columns([1.1, 1])
 with left_col:
     st.markdown("### Fatigue Factor")
     if not team_log.empty:
-        latest_game = team_log.sort_values("GAME_DATE").iloc[-1]
+        # The cached team log is already date-ordered, so the last row is the latest game
+        latest_game = team_log.iloc[-1]
         
-        # Safely calculate rest days with null checking
+        # GAME_DATE is datetime64 from the loader, so NaT is the only missing case
         game_date = latest_game["GAME_DATE"]
-        if pd.notna(game_date):
-            try:
-                game_date_ts = pd.Timestamp(game_date)
-                rest_days = max((pd.Timestamp.utcnow().date() - game_date_ts.date()).days, 0)
-            except (TypeError, AttributeError, ValueError):
-                rest_days = 1  # Default fallback
-        else:
-            rest_days = 1  # Default if date is NaT/missing
-        
+        rest_days = days_since(game_date) if pd.notna(game_date) else 1
+
         fatigue_inputs = models.FatigueInputs(
             rest_days=rest_days,
             is_home=bool(latest_game.get("IS_HOME", True)),
@@ -298,171 +514,190 @@ with left_col:
     else:
         fatigue_score = 0.0
 
-    gauge = go.Figure(
-        go.Indicator(
-            mode="gauge+number",
-            value=fatigue_score,
-            number={"font": {"color": "#FAFAFA"}},
-            gauge={
-                "axis": {"range": [0, 100]},
-                "bar": {"color": "#FF4B4B"},
-                "steps": [
-                    {"range": [0, 40], "color": "#00FFAA"},
-                    {"range": [40, 70], "color": "#FFD166"},
-                    {"range": [70, 100], "color": "#FF4B4B"},
-                ],
-            },
-        )
-    )
-    gauge.update_layout(height=260, margin=dict(l=20, r=20, t=20, b=20), paper_bgcolor="#0E1117")
-    st.plotly_chart(gauge, width="stretch")
+    # The gauge has no hover or zoom behavior, so render it as a static plot
+    gauge = build_fatigue_gauge(round(fatigue_score, 1))
+    st.plotly_chart(gauge, width="stretch", config={"staticPlot": True})
 
 with right_col:
     st.markdown("### 🎲 Prop Validator (Anomaly Detection)")
-    prop_data = models.build_prop_validator(player_log, stat_col="PTS")
+    prop_data = compute_prop_validator(sport, player_id, season)
     if prop_data.empty:
         st.info("No prop validator data available.")
     else:
         display_cols = ["GAME_DATE", "PTS", "Rolling_Avg", "Season_Avg", "Signal"]
-        prop_table = prop_data[display_cols].copy()
-
-        def highlight_signal(row: pd.Series) -> list[str]:
-            color = ""
-            if row["Signal"] == "Hot Streak":
-                color = "background-color: rgba(0, 255, 170, 0.2)"
-            elif row["Signal"] == "Cold Streak":
-                color = "background-color: rgba(255, 75, 75, 0.2)"
-            return [color] * len(row)
-
-        styled = prop_table.tail(10).style.apply(highlight_signal, axis=1)
-        st.dataframe(styled, use_container_width=True)
-
-
-st.markdown("---")  # Visual separator
+        prop_table = prop_data.iloc[-10:][display_cols]
+        # Plain column formatting keeps the table off the per-cell Styler payload
+        st.dataframe(
+            prop_table,
+            use_container_width=True,
+            column_config={
+                "GAME_DATE": st.column_config.DateColumn(),
+                "Rolling_Avg": st.column_config.NumberColumn(format="%.1f"),
+                "Season_Avg": st.column_config.NumberColumn(format="%.1f"),
+                "Signal": st.column_config.TextColumn(
+                    help="Hot/Cold Streak when the 5-game average is 20% above/below the season average"
+                ),
+            },
+        )
 
-trends_tab, advanced_tab, analytics_tab, comparisons_tab = st.tabs(
-    ["📈 Trends", "🎯 Advanced Stats", "📊 Analytics", "⚖️ Comparisons"]
-)
 
-with trends_tab:
+# Each tab renders inside its own fragment so interactions within a tab
+# rerun only that tab instead of the whole script.
+@st.fragment
+def render_trends_tab(
+    player_log: pd.DataFrame,
+    player_name: str,
+    sport: str,
+    season: str,
+    player_id: int,
+) -> None:
+    """Render the performance trends tab."""
     st.markdown("<div class='section-header'>Player Performance Trends</div>", unsafe_allow_html=True)
     if player_log.empty:
         st.info("No recent games available.")
-    else:
-        # Import enhanced visualizations
-        from components.shared.visualizations import (
-            create_performance_trend_chart,
-            create_distribution_chart,
-            create_multi_stat_comparison,
-        )
+        return
 
-        # Performance trend chart
-        trend_fig = create_performance_trend_chart(
-            player_log, "PTS", player_name, sport, show_rolling_avg=True
-        )
-        st.plotly_chart(trend_fig, use_container_width=True)
+    trend_fig, multi_stat_fig, dist_fig = build_trend_figures(sport, player_id, season, player_name)
 
-        # Multi-stat comparison
-        col1, col2 = st.columns([1, 1])
-        with col1:
-            multi_stat_fig = create_multi_stat_comparison(
-                player_log, ["PTS", "AST", "REB", "MIN"], player_name, sport
-            )
-            st.plotly_chart(multi_stat_fig, use_container_width=True)
+    # Performance trend chart
+    st.plotly_chart(trend_fig, use_container_width=True)
 
-        with col2:
-            # Distribution chart
-            dist_fig = create_distribution_chart(player_log, "PTS", player_name, sport)
-            st.plotly_chart(dist_fig, use_container_width=True)
+    # Multi-stat comparison
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        st.plotly_chart(multi_stat_fig, use_container_width=True)
 
-with advanced_tab:
+    with col2:
+        # Distribution chart
+        st.plotly_chart(dist_fig, use_container_width=True)
+
+
+@st.fragment
+def render_advanced_tab(
+    league_stats: pd.DataFrame,
+    feature_cols: list[str],
+    player_name: str,
+    sport: str,
+    season: str,
+) -> None:
+    """Render the player vs league advanced stats tab."""
     st.markdown("<div class='section-header'>Player vs League Average Radar</div>", unsafe_allow_html=True)
     if league_stats.empty or not feature_cols:
         st.info("League stats not available.")
-    else:
-        from components.shared.visualizations import create_enhanced_radar_chart
-
-        player_row = league_stats[league_stats["Player"] == player_name]
-        league_avg = league_stats[feature_cols].mean(numeric_only=True)
-        if player_row.empty:
-            st.info("Player not found in league stats.")
-        else:
-            player_values = player_row.iloc[0][feature_cols]
-            
-            # Enhanced radar chart
-            radar_fig = create_enhanced_radar_chart(
-                player_values, league_avg, feature_cols, player_name, sport
-            )
-            st.plotly_chart(radar_fig, use_container_width=True)
-
-            # Advanced stats table
-            st.markdown("### 📊 Detailed Statistics")
-            stats_df = pd.DataFrame(
-                {
-                    "Metric": feature_cols,
-                    "Player": player_values.values,
-                    "League Avg": league_avg.values,
-                    "Percentile": [
-                        (league_stats[col] < player_values[col]).sum() / len(league_stats) * 100
-                        for col in feature_cols
-                    ],
-                }
-            )
-            stats_df["Percentile"] = stats_df["Percentile"].apply(lambda x: f"{x:.0f}%")
-            st.dataframe(stats_df, use_container_width=True)
-
-with analytics_tab:
+        return
+
+    player_mask = league_stats["Player"].to_numpy() == player_name
+    league_avg = compute_league_averages(sport, season, tuple(feature_cols))
+    if not player_mask.any():
+        st.info("Player not found in league stats.")
+        return
+
+    # Read the player's features straight into a float64 vector with one indexer
+    player_array = league_stats.loc[player_mask, feature_cols].to_numpy(dtype="float64")[0]
+
+    # Enhanced radar chart
+    radar_fig = build_radar_figure(
+        tuple(player_array.tolist()),
+        tuple(league_avg.tolist()),
+        tuple(feature_cols),
+        player_name,
+        sport,
+    )
+    st.plotly_chart(radar_fig, use_container_width=True)
+
+    # Advanced stats table
+    st.markdown("### 📊 Detailed Statistics")
+    # One broadcast comparison over the feature block instead of a scan per column
+    percentiles = (
+        league_stats[feature_cols].to_numpy(dtype="float64") < player_array
+    ).mean(axis=0) * 100
+    stats_df = pd.DataFrame(
+        {
+            "Metric": feature_cols,
+            "Player": player_array,
+            "League Avg": league_avg.values,
+            "Percentile": percentiles,
+        }
+    )
+    stats_df["Percentile"] = stats_df["Percentile"].apply(lambda x: f"{x:.0f}%")
+    st.dataframe(stats_df, use_container_width=True)
+
+
+@st.fragment
+def render_analytics_tab(
+    player_log: pd.DataFrame,
+    player_name: str,
+    sport: str,
+    season: str,
+    player_id: int,
+    points_avg: float,
+) -> None:
+    """Render the home/away and recent form analytics tab."""
     st.markdown("<div class='section-header'>Performance Analytics</div>", unsafe_allow_html=True)
     if player_log.empty:
         st.info("No game data available for analytics.")
-    else:
-        from components.shared.visualizations import create_home_away_comparison
+        return
+
+    # Home vs Away performance
+    home_away_fig = build_home_away_figure(sport, player_id, season, player_name)
+    st.plotly_chart(home_away_fig, use_container_width=True)
+
+    # Recent form analysis
+    st.markdown("### 🔥 Recent Form")
+    last_5 = player_log.iloc[-5:]
+    last_10 = player_log.iloc[-10:]
+
+    last_5_ppg = safe_mean(last_5["PTS"])
+    last_10_ppg = safe_mean(last_10["PTS"])
+    hot_streak = (last_5["PTS"] > points_avg).sum()
+    render_metric_grid(
+        [
+            ("Last 5 Games PPG", f"{last_5_ppg:.1f}", f"{last_5_ppg - points_avg:+.1f}"),
+            ("Last 10 Games PPG", f"{last_10_ppg:.1f}", f"{last_10_ppg - points_avg:+.1f}"),
+            ("Hot Games (Last 5)", f"{hot_streak}/5"),
+        ]
+    )
 
-        # Home vs Away performance
-        home_away_fig = create_home_away_comparison(
-            player_log, ["PTS", "AST", "REB"], player_name, sport
-        )
-        st.plotly_chart(home_away_fig, use_container_width=True)
-
-        # Recent form analysis
-        st.markdown("### 🔥 Recent Form")
-        last_5 = player_log.sort_values("GAME_DATE").tail(5)
-        last_10 = player_log.sort_values("GAME_DATE").tail(10)
-
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric(
-                "Last 5 Games PPG",
-                f"{safe_mean(last_5['PTS']):.1f}",
-                f"{safe_mean(last_5['PTS']) - points_avg:+.1f}",
-            )
-        with col2:
-            st.metric(
-                "Last 10 Games PPG",
-                f"{safe_mean(last_10['PTS']):.1f}",
-                f"{safe_mean(last_10['PTS']) - points_avg:+.1f}",
-            )
-        with col3:
-            hot_streak = (last_5["PTS"] > points_avg).sum()
-            st.metric("Hot Games (Last 5)", f"{hot_streak}/5")
 
-with comparisons_tab:
+@st.fragment
+def render_comparisons_tab(
+    feature_cols: list[str],
+    player_name: str,
+    sport: str,
+    season: str,
+) -> None:
+    """Render the player similarity comparisons tab."""
     st.markdown("<div class='section-header'>Player Comparisons & Similarity</div>", unsafe_allow_html=True)
-    
+
     # Player Similarity Engine
-    desired_features = ["Points", "Assists", "Rebounds", "UsageRate", "TrueShootingPct"]
-    feature_cols = [col for col in desired_features if col in league_stats.columns]
-    comps = models.find_player_comps(league_stats, player_name, feature_cols)
-    
+    comps = compute_player_comps(sport, season, player_name, tuple(feature_cols))
+
     if comps.empty:
         st.info("Similarity comps are not available for this player yet.")
     else:
         st.markdown("### 🎯 Similar Players")
         st.dataframe(
-            comps[["Player", "Team", "Points", "Assists", "Rebounds", "SimilarityScore"]]
-            .sort_values("SimilarityScore", ascending=False)
-            .reset_index(drop=True),
+            comps[["Player", "Team", "Points", "Assists", "Rebounds", "SimilarityScore"]],
             use_container_width=True,
         )
 
+
+st.markdown("---")  # Visual separator
+
+trends_tab, advanced_tab, analytics_tab, comparisons_tab = st.tabs(
+    ["📈 Trends", "🎯 Advanced Stats", "📊 Analytics", "⚖️ Comparisons"]
+)
+
+with trends_tab:
+    render_trends_tab(player_log, player_name, sport, season, player_id)
+
+with advanced_tab:
+    render_advanced_tab(league_stats, feature_cols, player_name, sport, season)
+
+with analytics_tab:
+    render_analytics_tab(player_log, player_name, sport, season, player_id, points_avg)
+
+with comparisons_tab:
+    render_comparisons_tab(feature_cols, player_name, sport, season)
+
 st.caption("Signal Sports Analytics • MVP build for portfolio")
@@ -2,11 +2,33 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from itertools import cycle
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from utils import rolling_mean, sort_by_date
+
+
+# Shared placeholder returned when there is nothing to plot; callers must not mutate it
+_EMPTY_FIGURE = go.Figure()
+
+
+@lru_cache(maxsize=64)
+def _trend_hovertemplate(stat_col: str) -> str:
+    """Return the date/value hover template for a stat's trend trace."""
+    return f"<b>%{{x|%b %d}}</b><br>{stat_col}: %{{y:.1f}}<extra></extra>"
+
+
+@lru_cache(maxsize=64)
+def _distribution_hovertemplate(stat_col: str) -> str:
+    """Return the bin/count hover template for a stat's histogram."""
+    return f"%{{x}} {stat_col}<br>Count: %{{y}}<extra></extra>"
+
 
 def create_performance_trend_chart(
     data: pd.DataFrame,
@@ -28,36 +50,37 @@ def create_performance_trend_chart(
         Plotly figure object
     """
     if data.empty or stat_col not in data.columns:
-        return go.Figure()
+        return _EMPTY_FIGURE
 
-    # Sort by date
-    plot_data = data.sort_values("GAME_DATE").tail(20).copy()
+    # Sort by date, keeping only the columns the chart reads
+    plot_data = sort_by_date(data[["GAME_DATE", stat_col]]).iloc[-20:]
 
     # Calculate rolling average
     if show_rolling_avg:
-        plot_data["Rolling_5"] = plot_data[stat_col].rolling(window=5, min_periods=1).mean()
-        plot_data["Rolling_10"] = plot_data[stat_col].rolling(window=10, min_periods=1).mean()
+        plot_data = plot_data.assign(
+            Rolling_5=rolling_mean(plot_data[stat_col].to_numpy(dtype="float64"), window=5)
+        )
 
-    # Create figure
+    # Create figure (Scattergl draws through WebGL instead of SVG)
     fig = go.Figure()
 
     # Add actual performance
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=plot_data["GAME_DATE"],
             y=plot_data[stat_col],
             mode="lines+markers",
             name="Actual",
             line=dict(color="#00FFAA", width=2),
             marker=dict(size=8, color="#00FFAA"),
-            hovertemplate="<b>%{x|%b %d}</b><br>" + f"{stat_col}: %{{y:.1f}}<extra></extra>",
+            hovertemplate=_trend_hovertemplate(stat_col),
         )
     )
 
     # Add rolling averages
     if show_rolling_avg:
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=plot_data["GAME_DATE"],
                 y=plot_data["Rolling_5"],
                 mode="lines",
@@ -125,11 +148,11 @@ def create_distribution_chart(
         Plotly figure object
     """
     if data.empty or stat_col not in data.columns:
-        return go.Figure()
+        return _EMPTY_FIGURE
 
     values = data[stat_col].dropna()
     if values.empty:
-        return go.Figure()
+        return _EMPTY_FIGURE
 
     # Create histogram
     fig = go.Figure()
@@ -143,7 +166,7 @@ def create_distribution_chart(
                 color="#00FFAA",
                 line=dict(color="#FFFFFF", width=1),
             ),
-            hovertemplate="%{x} " + stat_col + "<br>Count: %{y}<extra></extra>",
+            hovertemplate=_distribution_hovertemplate(stat_col),
         )
     )
 
@@ -199,44 +222,45 @@ def create_multi_stat_comparison(
         Plotly figure object with subplots
     """
     if data.empty:
-        return go.Figure()
+        return _EMPTY_FIGURE
 
     # Filter available columns
     available_cols = [col for col in stat_cols if col in data.columns]
     if not available_cols:
-        return go.Figure()
+        return _EMPTY_FIGURE
 
-    plot_data = data.sort_values("GAME_DATE").tail(15).copy()
+    # Plotly only reads the columns, so the tail slice needs no copy
+    plot_data = sort_by_date(data[["GAME_DATE", *available_cols]]).iloc[-15:]
 
     # Create subplots
     rows = (len(available_cols) + 1) // 2
     fig = make_subplots(
         rows=rows,
         cols=2,
-        subplot_titles=[col for col in available_cols],
+        subplot_titles=available_cols,
         vertical_spacing=0.12,
         horizontal_spacing=0.1,
     )
 
     colors = ["#00FFAA", "#FFD166", "#FF4B4B", "#1D428A", "#C8102E"]
 
-    for idx, col in enumerate(available_cols):
-        row = (idx // 2) + 1
-        col_pos = (idx % 2) + 1
-
-        fig.add_trace(
-            go.Scatter(
+    # Collect every subplot trace and add them in one batch
+    traces, trace_rows, trace_cols = [], [], []
+    for idx, (col, color) in enumerate(zip(available_cols, cycle(colors))):
+        traces.append(
+            go.Scattergl(
                 x=plot_data["GAME_DATE"],
                 y=plot_data[col],
                 mode="lines+markers",
                 name=col,
-                line=dict(color=colors[idx % len(colors)], width=2),
+                line=dict(color=color, width=2),
                 marker=dict(size=6),
                 showlegend=False,
-            ),
-            row=row,
-            col=col_pos,
+            )
         )
+        trace_rows.append((idx // 2) + 1)
+        trace_cols.append((idx % 2) + 1)
+    fig.add_traces(traces, rows=trace_rows, cols=trace_cols)
 
     fig.update_layout(
         title=f"{player_name} - Multi-Stat Trends (Last 15 Games)",
@@ -257,6 +281,7 @@ def create_home_away_comparison(
     stat_cols: list[str],
     player_name: str,
     sport: str = "NBA",
+    venue_means: pd.DataFrame | None = None,
 ) -> go.Figure:
     """Create a home vs away performance comparison chart.
 
@@ -265,24 +290,26 @@ def create_home_away_comparison(
         stat_cols: List of statistic columns to compare
         player_name: Player name for title
         sport: Sport name for theming
+        venue_means: Optional precomputed means indexed by IS_HOME; computed
+            from data when omitted
 
     Returns:
         Plotly figure object
     """
     if data.empty or "IS_HOME" not in data.columns:
-        return go.Figure()
+        return _EMPTY_FIGURE
 
     # Filter available columns
     available_cols = [col for col in stat_cols if col in data.columns]
     if not available_cols:
-        return go.Figure()
-
-    # Calculate averages
-    home_data = data[data["IS_HOME"] == True]
-    away_data = data[data["IS_HOME"] == False]
+        return _EMPTY_FIGURE
 
-    home_avgs = [home_data[col].mean() if not home_data.empty else 0 for col in available_cols]
-    away_avgs = [away_data[col].mean() if not away_data.empty else 0 for col in available_cols]
+    # Calculate averages in one grouped pass when they are not supplied
+    if venue_means is None:
+        venue_means = data.groupby("IS_HOME")[available_cols].mean()
+    venue_means = venue_means.reindex(index=[True, False], columns=available_cols).fillna(0)
+    home_avgs = venue_means.loc[True].tolist()
+    away_avgs = venue_means.loc[False].tolist()
 
     # Create grouped bar chart
     fig = go.Figure()
@@ -340,8 +367,8 @@ def create_enhanced_radar_chart(
     """Create an enhanced radar chart comparing player to league average.
 
     Args:
-        player_data: Player statistics Series
-        league_avg: League average statistics Series
+        player_data: Player statistics, ordered like stat_cols (Series or array)
+        league_avg: League average statistics, ordered like stat_cols (Series or array)
         stat_cols: List of statistic columns
         player_name: Player name for title
         sport: Sport name for theming
@@ -349,20 +376,23 @@ def create_enhanced_radar_chart(
     Returns:
         Plotly figure object
     """
-    if player_data.empty or league_avg.empty:
-        return go.Figure()
+    if len(player_data) == 0 or len(league_avg) == 0:
+        return _EMPTY_FIGURE
 
-    # Normalize values to 0-100 scale for better visualization
-    max_vals = league_avg * 2  # Use 2x league average as max
-    player_normalized = ((player_data / max_vals) * 100).clip(0, 100)
-    league_normalized = ((league_avg / max_vals) * 100).clip(0, 100)
+    # Normalize values to 0-100 scale for better visualization, on plain arrays
+    player_values = np.asarray(player_data, dtype="float64")
+    league_values = np.asarray(league_avg, dtype="float64")
+    max_vals = league_values * 2  # Use 2x league average as max
+    with np.errstate(divide="ignore", invalid="ignore"):
+        player_normalized = np.clip(player_values / max_vals * 100, 0, 100)
+        league_normalized = np.clip(league_values / max_vals * 100, 0, 100)
 
     fig = go.Figure()
 
     # Player trace
     fig.add_trace(
         go.Scatterpolar(
-            r=player_normalized.values,
+            r=player_normalized,
             theta=stat_cols,
             fill="toself",
             name=player_name,
@@ -374,7 +404,7 @@ def create_enhanced_radar_chart(
     # League average trace
     fig.add_trace(
         go.Scatterpolar(
-            r=league_normalized.values,
+            r=league_normalized,
             theta=stat_cols,
             fill="toself",
             name="League Avg",
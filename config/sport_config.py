@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 
 class SportConfig:
     """Configuration for different sports."""
@@ -36,16 +39,23 @@ class SportConfig:
     }
 
     @classmethod
-    def get_sport_config(cls, sport: str) -> dict:
-        """Get configuration for a specific sport."""
-        if sport == "NBA":
-            return cls.NBA
-        elif sport == "NHL":
-            return cls.NHL
-        else:
-            raise ValueError(f"Unknown sport: {sport}")
+    def get_sport_config(cls, sport: str) -> Mapping:
+        """Get the read-only configuration for a specific sport."""
+        try:
+            return _SPORTS[sport]
+        except KeyError:
+            raise ValueError(f"Unknown sport: {sport}") from None
 
     @classmethod
     def get_available_sports(cls) -> list[str]:
         """Get list of available sports."""
-        return ["NBA", "NHL"]
+        return list(_SPORTS)
+
+
+# Read-only views over the configs, looked up by sport name
+_SPORTS: Mapping[str, Mapping] = MappingProxyType(
+    {
+        "NBA": MappingProxyType(SportConfig.NBA),
+        "NHL": MappingProxyType(SportConfig.NHL),
+    }
+)
@@ -6,10 +6,9 @@ from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
-from sklearn.neighbors import NearestNeighbors
-from sklearn.preprocessing import StandardScaler
+from scipy.spatial import cKDTree
 
-from utils import clamp, compute_rolling_average, safe_mean
+from utils import clamp, clamp_array, rolling_mean, safe_mean, sort_by_date
 
 
 @dataclass
@@ -28,37 +27,152 @@ def calculate_fatigue_score(inputs: FatigueInputs) -> float:
     travel_component = 10 if not inputs.is_home else 0
     minutes_component = clamp((inputs.minutes_last_game / 48) * 40, 0, 40)
     raw_score = rest_component + travel_component + minutes_component
-    return clamp(raw_score, 0, 100)
+    return clamp(raw_score, 0.0, 100.0)
 
 
-def build_similarity_model(stats: pd.DataFrame, feature_cols: list[str]) -> tuple[NearestNeighbors, StandardScaler]:
-    """Fit a KNN model for player similarity."""
-    scaler = StandardScaler()
-    feature_matrix = scaler.fit_transform(stats[feature_cols].fillna(0))
-    model = NearestNeighbors(n_neighbors=4, metric="euclidean")
-    model.fit(feature_matrix)
-    return model, scaler
+def calculate_fatigue_scores(
+    rest_days: np.ndarray, is_home: np.ndarray, minutes_last_game: np.ndarray
+) -> np.ndarray:
+    """Vectorized ``calculate_fatigue_score`` over aligned arrays of inputs."""
+    rest_days = np.asarray(rest_days, dtype="float64")
+    minutes_last_game = np.asarray(minutes_last_game, dtype="float64")
+    # Each component is a fresh temporary, so clamp_array clips it in place
+    rest_component = clamp_array(100 - rest_days * 15, 0, 100)
+    # Away games add 10 points of travel; the bool mask scales it without a branch
+    travel_component = 10.0 * ~np.asarray(is_home, dtype=bool)
+    minutes_component = clamp_array((minutes_last_game / 48) * 40, 0, 40)
+    return clamp_array(rest_component + travel_component + minutes_component, 0, 100)
+
+
+def calculate_fatigue_series(game_log: pd.DataFrame) -> np.ndarray:
+    """Return the fatigue score entering each game of a date-ordered game log.
+
+    Rest is the gap since the previous game (1 day when unknown), venue is the
+    game's own ``IS_HOME`` and minutes come from the previous game.
+    """
+    if game_log.empty:
+        return np.empty(0, dtype="float64")
+    n_games = len(game_log)
+    rest_days = np.ones(n_games)
+    if "GAME_DATE" in game_log.columns:
+        gaps = game_log["GAME_DATE"].diff().dt.days.to_numpy(dtype="float64", na_value=np.nan)
+        rest_days = np.where(np.isnan(gaps), 1.0, gaps)
+    is_home = (
+        game_log["IS_HOME"].to_numpy(dtype=bool, na_value=True)
+        if "IS_HOME" in game_log.columns
+        else np.ones(n_games, dtype=bool)
+    )
+    minutes = np.zeros(n_games)
+    if "MIN" in game_log.columns:
+        minutes[1:] = game_log["MIN"].to_numpy(dtype="float64", na_value=0.0)[:-1]
+    return calculate_fatigue_scores(rest_days, is_home, minutes)
+
+
+def build_feature_matrix(stats: pd.DataFrame, feature_cols: list[str]) -> np.ndarray:
+    """Z-score the feature columns into a float32 matrix for similarity search."""
+    if stats.empty:
+        return np.empty((0, len(feature_cols)), dtype="float32")
+    # na_value zero-fills during the array conversion, so no filled DataFrame is allocated
+    features = stats[feature_cols].to_numpy(dtype="float64", na_value=0.0)
+    scale = features.std(axis=0)
+    scale[scale == 0] = 1.0  # constant columns contribute nothing, as with StandardScaler
+    # Frames hand back column-major blocks; row-major float32 keeps the X @ q products on SGEMV
+    return np.ascontiguousarray((features - features.mean(axis=0)) / scale, dtype="float32")
+
+
+def _nearest_rows(
+    feature_matrix: np.ndarray, query_rows: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the indices and distances of the ``k`` nearest rows to each query row, self excluded."""
+    features = np.ascontiguousarray(feature_matrix, dtype="float32")
+    queries = features[query_rows]
+    # ||x - q||^2 / 2 minus the constant ||q||^2 / 2: one matrix product ranks the league per query
+    scores = 0.5 * np.einsum("ij,ij->i", features, features) - queries @ features.T
+    scores[np.arange(len(query_rows)), query_rows] = np.inf
+    # Partial sort for the k nearest, then order only those k
+    nearest = np.argpartition(scores, k - 1, axis=1)[:, :k]
+    nearest_scores = np.take_along_axis(scores, nearest, axis=1)
+    order = np.argsort(nearest_scores, axis=1)
+    nearest = np.take_along_axis(nearest, order, axis=1)
+    nearest_scores = np.take_along_axis(nearest_scores, order, axis=1)
+    query_norms = np.einsum("ij,ij->i", queries, queries)[:, None]
+    return nearest, np.sqrt(np.maximum(2 * nearest_scores + query_norms, 0))
+
+
+def _comps_frame(stats: pd.DataFrame, comp_indices: np.ndarray, comp_distances: np.ndarray) -> pd.DataFrame:
+    """Slice the comp rows out of ``stats`` and attach their similarity scores."""
+    comps = stats.iloc[comp_indices].reset_index(drop=True)
+    comp_distances = np.asarray(comp_distances, dtype="float32")
+    comps["SimilarityScore"] = 1 - comp_distances / max(comp_distances.max(), 1e-6)
+    return comps
 
 
 def find_player_comps(
     stats: pd.DataFrame,
     player_name: str,
     feature_cols: list[str],
+    feature_matrix: np.ndarray | None = None,
+    n_comps: int = 3,
+    comp_index: cKDTree | None = None,
 ) -> pd.DataFrame:
-    """Return the top 3 similar players for a given player."""
+    """Return the top ``n_comps`` similar players for a given player.
+
+    Rows are ordered from most to least similar. Pass a precomputed
+    ``build_feature_matrix`` result to skip re-standardizing the league, or a
+    ``cKDTree`` built over it to answer with a tree query instead of a full scan.
+    """
+    # The tree answers by row position, so only trust one built over this exact frame
+    if comp_index is None or comp_index.n != len(stats):
+        return find_player_comps_batch(
+            stats, [player_name], feature_cols, feature_matrix=feature_matrix, n_comps=n_comps
+        ).get(player_name, pd.DataFrame())
     if stats.empty or any(col not in stats.columns for col in feature_cols):
         return pd.DataFrame()
-    model, scaler = build_similarity_model(stats, feature_cols)
-    player_row = stats[stats["Player"] == player_name]
-    if player_row.empty:
+    matches = np.flatnonzero(stats["Player"].to_numpy() == player_name)
+    k = min(n_comps, len(stats) - 1)
+    if matches.size == 0 or k <= 0:
         return pd.DataFrame()
 
-    player_vector = scaler.transform(player_row[feature_cols].fillna(0))
-    distances, indices = model.kneighbors(player_vector, n_neighbors=4)
-    comp_indices = indices[0][1:]
-    comps = stats.iloc[comp_indices].copy()
-    comps["SimilarityScore"] = 1 - (distances[0][1:] / max(distances[0][1:].max(), 1e-6))
-    return comps
+    player_idx = matches[0]
+    # Ask for one extra neighbour since the player is their own nearest match
+    comp_distances, comp_indices = comp_index.query(comp_index.data[player_idx], k=k + 1)
+    keep = comp_indices != player_idx
+    return _comps_frame(stats, comp_indices[keep][:k], comp_distances[keep][:k])
+
+
+def find_player_comps_batch(
+    stats: pd.DataFrame,
+    player_names: list[str],
+    feature_cols: list[str],
+    feature_matrix: np.ndarray | None = None,
+    n_comps: int = 3,
+) -> dict[str, pd.DataFrame]:
+    """Return ``find_player_comps`` results for several players from one matrix product.
+
+    Names missing from ``stats`` map to an empty DataFrame.
+    """
+    results = {name: pd.DataFrame() for name in player_names}
+    if stats.empty or any(col not in stats.columns for col in feature_cols):
+        return results
+    k = min(n_comps, len(stats) - 1)
+    if k <= 0:
+        return results
+
+    first_row = pd.Series(np.arange(len(stats)), index=stats["Player"].to_numpy())
+    first_row = first_row[~first_row.index.duplicated()]
+    found = [name for name in dict.fromkeys(player_names) if name in first_row.index]
+    if not found:
+        return results
+    if feature_matrix is None:
+        feature_matrix = build_feature_matrix(stats, feature_cols)
+    comp_indices, comp_distances = _nearest_rows(feature_matrix, first_row[found].to_numpy(), k)
+    for name, indices, distances in zip(found, comp_indices, comp_distances):
+        results[name] = _comps_frame(stats, indices, distances)
+    return results
+
+
+# Signal categories, ordered so the code is -1/0/+1 (cold/neutral/hot) shifted by one
+_SIGNAL_CATEGORIES = ["Cold Streak", "Neutral", "Hot Streak"]
 
 
 def build_prop_validator(game_log: pd.DataFrame, stat_col: str = "PTS") -> pd.DataFrame:
@@ -67,20 +181,16 @@ def build_prop_validator(game_log: pd.DataFrame, stat_col: str = "PTS") -> pd.Da
         return pd.DataFrame()
 
     if "GAME_DATE" in game_log.columns:
-        sorted_games = game_log.sort_values("GAME_DATE")
-    else:
-        sorted_games = game_log.copy()
-    sorted_games["Rolling_Avg"] = compute_rolling_average(sorted_games[stat_col], window=5)
-    season_avg = safe_mean(sorted_games[stat_col])
-    sorted_games["Season_Avg"] = season_avg
-
-    sorted_games["Signal"] = np.where(
-        sorted_games["Rolling_Avg"] > season_avg * 1.2,
-        "Hot Streak",
-        np.where(
-            sorted_games["Rolling_Avg"] < season_avg * 0.8,
-            "Cold Streak",
-            "Neutral",
-        ),
+        game_log = sort_by_date(game_log)
+    values = game_log[stat_col].to_numpy(dtype="float64", na_value=np.nan)
+    rolling_avg = rolling_mean(values, window=5)
+    season_avg = safe_mean(values)
+
+    signal_codes = (rolling_avg > season_avg * 1.2).view(np.int8) - (
+        rolling_avg < season_avg * 0.8
+    ).view(np.int8)
+    return game_log.assign(
+        Rolling_Avg=rolling_avg,
+        Season_Avg=season_avg,
+        Signal=pd.Categorical.from_codes(signal_codes + 1, _SIGNAL_CATEGORIES),
     )
-    return sorted_games
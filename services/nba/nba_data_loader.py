@@ -2,14 +2,39 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from nba_api.stats.endpoints import leaguedashplayerstats, playergamelog, teamgamelog
 from nba_api.stats.static import players, teams
 
 from services.shared.base_data_loader import BaseDataLoader
+from utils import cached_frame
+
+
+@lru_cache(maxsize=1)
+def _player_ids_by_name() -> dict[str, int]:
+    """Map NBA player full names to IDs from nba_api's bundled static list."""
+    # Reversed so the first listed player wins on duplicate names, as in the search
+    return {player["full_name"]: player["id"] for player in reversed(players.get_players())}
+
+
+@lru_cache(maxsize=1)
+def _team_ids_by_name() -> dict[str, int]:
+    """Map NBA team full names to IDs from nba_api's bundled static list."""
+    return {team["full_name"]: team["id"] for team in reversed(teams.get_teams())}
+
+
+@lru_cache(maxsize=256)
+def _search_player_id(player_name: str) -> Optional[int]:
+    """Return the first ID from nba_api's case-insensitive name search."""
+    matches = players.find_players_by_full_name(player_name)
+    if not matches:
+        return None
+    return matches[0]["id"]
 
 
 class NBADataLoader(BaseDataLoader):
@@ -36,23 +61,21 @@ class NBADataLoader(BaseDataLoader):
 
     def get_player_id(self, player_name: str) -> Optional[int]:
         """Return the NBA player ID for a given full name."""
-        matches = players.find_players_by_full_name(player_name)
-        if not matches:
-            return None
-        return matches[0]["id"]
+        player_id = _player_ids_by_name().get(player_name)
+        if player_id is None:
+            player_id = _search_player_id(player_name)
+        return player_id
 
     def get_team_id(self, team_name: str) -> Optional[int]:
         """Return the NBA team ID for a given full name."""
-        matches = [team for team in teams.get_teams() if team["full_name"] == team_name]
-        if not matches:
-            return None
-        return matches[0]["id"]
+        return _team_ids_by_name().get(team_name)
 
     def load_player_game_log(
         self,
         player_id: int,
         season: str = None,
         season_type: str = None,
+        force_refresh: bool = False,
     ) -> pd.DataFrame:
         """Fetch and clean a player's game log for a given season."""
         if season is None:
@@ -61,21 +84,26 @@ class NBADataLoader(BaseDataLoader):
             season_type = self.DEFAULT_SEASON_TYPE
 
         try:
-            response = playergamelog.PlayerGameLog(
-                player_id=player_id,
-                season=season,
-                season_type_all_star=season_type,
+            return cached_frame(
+                f"nba/player_game_log/{player_id}_{season}_{season_type}",
+                lambda: self._clean_game_log(
+                    playergamelog.PlayerGameLog(
+                        player_id=player_id,
+                        season=season,
+                        season_type_all_star=season_type,
+                    ).get_data_frames()[0]
+                ),
+                force_refresh=force_refresh,
             )
-            data = response.get_data_frames()[0]
         except Exception:
             return pd.DataFrame()
-        return self._clean_game_log(data)
 
     def load_team_game_log(
         self,
         team_id: int,
         season: str = None,
         season_type: str = None,
+        force_refresh: bool = False,
     ) -> pd.DataFrame:
         """Fetch and clean a team's game log for a given season."""
         if season is None:
@@ -84,20 +112,25 @@ class NBADataLoader(BaseDataLoader):
             season_type = self.DEFAULT_SEASON_TYPE
 
         try:
-            response = teamgamelog.TeamGameLog(
-                team_id=team_id,
-                season=season,
-                season_type_all_star=season_type,
+            return cached_frame(
+                f"nba/team_game_log/{team_id}_{season}_{season_type}",
+                lambda: self._clean_game_log(
+                    teamgamelog.TeamGameLog(
+                        team_id=team_id,
+                        season=season,
+                        season_type_all_star=season_type,
+                    ).get_data_frames()[0]
+                ),
+                force_refresh=force_refresh,
             )
-            data = response.get_data_frames()[0]
         except Exception:
             return pd.DataFrame()
-        return self._clean_game_log(data)
 
     def load_league_player_stats(
         self,
         season: str = None,
         season_type: str = None,
+        force_refresh: bool = False,
     ) -> pd.DataFrame:
         """Load league-wide player stats for similarity comparisons."""
         if season is None:
@@ -106,15 +139,20 @@ class NBADataLoader(BaseDataLoader):
             season_type = self.DEFAULT_SEASON_TYPE
 
         try:
-            response = leaguedashplayerstats.LeagueDashPlayerStats(
-                season=season,
-                season_type_all_star=season_type,
-                per_mode_detailed="PerGame",
+            return cached_frame(
+                f"nba/league_player_stats/{season}_{season_type}",
+                lambda: self._clean_league_stats(
+                    leaguedashplayerstats.LeagueDashPlayerStats(
+                        season=season,
+                        season_type_all_star=season_type,
+                        per_mode_detailed="PerGame",
+                    ).get_data_frames()[0],
+                    season=season,
+                ),
+                force_refresh=force_refresh,
             )
-            data = response.get_data_frames()[0]
         except Exception:
             return pd.DataFrame()
-        return self._clean_league_stats(data, season=season)
 
     def get_stat_columns(self) -> dict[str, list[str]]:
         """Return NBA-specific stat column mappings."""
@@ -131,13 +169,19 @@ class NBADataLoader(BaseDataLoader):
         }
 
     def _clean_game_log(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Standardize game log fields for downstream analytics."""
-        cleaned = data.copy()
+        """Standardize game log fields in place for downstream analytics.
+
+        The fetched frame is owned by the loader, so it is updated without a copy.
+        """
+        cleaned = data
         if "GAME_DATE" in cleaned.columns:
+            # Game logs report dates like "OCT 25, 2023"; cache=True parses each
+            # distinct date string once
             cleaned["GAME_DATE"] = pd.to_datetime(
                 cleaned["GAME_DATE"],
-                format="%Y-%m-%d",
+                format="%b %d, %Y",
                 errors="coerce",
+                cache=True,
             )
 
         numeric_cols = [
@@ -153,18 +197,20 @@ class NBADataLoader(BaseDataLoader):
             "FTA",
             "PLUS_MINUS",
         ]
-        for col in numeric_cols:
-            if col in cleaned.columns:
-                cleaned[col] = pd.to_numeric(cleaned[col], errors="coerce")
+        self._coerce_numeric(cleaned, numeric_cols)
 
         if "MATCHUP" in cleaned.columns:
-            cleaned["IS_HOME"] = cleaned["MATCHUP"].str.contains("vs.", na=False)
+            # Matchups read "DAL vs. LAL" at home and "DAL @ LAL" away. A season has
+            # only a few dozen distinct matchups, so test those once and map the codes;
+            # the trailing False catches the -1 code of a missing matchup
+            matchups = pd.Categorical(cleaned["MATCHUP"])
+            home_matchups = np.array([" vs. " in matchup for matchup in matchups.categories] + [False])
+            cleaned["IS_HOME"] = home_matchups[matchups.codes]
 
         return cleaned
 
     def _clean_league_stats(self, data: pd.DataFrame, season: str) -> pd.DataFrame:
         """Clean league stats and normalize column naming."""
-        cleaned = data.copy()
         rename_map = {
             "PLAYER_NAME": "Player",
             "TEAM_ABBREVIATION": "Team",
@@ -174,15 +220,27 @@ class NBADataLoader(BaseDataLoader):
             "USG_PCT": "UsageRate",
             "TS_PCT": "TrueShootingPct",
         }
-        cleaned = cleaned.rename(columns=rename_map)
+        # rename() returns a new frame, so the fetched data needs no defensive copy
+        cleaned = data.rename(columns=rename_map)
+        # Names repeat across few distinct values, so store them as category codes
+        for col in ("Player", "Team"):
+            if col in cleaned.columns:
+                cleaned[col] = cleaned[col].astype("category")
 
         metric_cols = ["Points", "Assists", "Rebounds", "UsageRate", "TrueShootingPct"]
-        for col in metric_cols:
+        # Coerce the present metrics in one block and add any missing ones together
+        self._coerce_numeric(cleaned, metric_cols)
+        missing = [col for col in metric_cols if col not in cleaned.columns]
+        if missing:
+            cleaned = cleaned.assign(**dict.fromkeys(missing, 0.0))
+
+        # ID columns fit in int32, which halves them in the cached frame
+        for col in ("PLAYER_ID", "TEAM_ID"):
             if col in cleaned.columns:
-                cleaned[col] = pd.to_numeric(cleaned[col], errors="coerce")
-            else:
-                cleaned[col] = 0.0
+                cleaned[col] = pd.to_numeric(cleaned[col], errors="coerce", downcast="integer")
 
-        cleaned["Season"] = season
-        cleaned["LastUpdated"] = datetime.utcnow()
+        # Every row shares the season, so a one-category column stores a code byte per row
+        cleaned["Season"] = pd.Categorical.from_codes(np.zeros(len(cleaned), dtype="int8"), [season])
+        # Naive UTC timestamp stored as a datetime64 column
+        cleaned["LastUpdated"] = datetime.now(timezone.utc).replace(tzinfo=None)
         return cleaned
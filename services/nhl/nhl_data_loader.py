@@ -10,6 +10,46 @@ import pandas as pd
 from services.shared.base_data_loader import BaseDataLoader
 
 
+# Current NHL teams for 2023-24 season (32 teams)
+_NHL_TEAMS = [
+    {"id": 1, "full_name": "New Jersey Devils", "abbreviation": "NJD"},
+    {"id": 2, "full_name": "New York Islanders", "abbreviation": "NYI"},
+    {"id": 3, "full_name": "New York Rangers", "abbreviation": "NYR"},
+    {"id": 4, "full_name": "Philadelphia Flyers", "abbreviation": "PHI"},
+    {"id": 5, "full_name": "Pittsburgh Penguins", "abbreviation": "PIT"},
+    {"id": 6, "full_name": "Boston Bruins", "abbreviation": "BOS"},
+    {"id": 7, "full_name": "Buffalo Sabres", "abbreviation": "BUF"},
+    {"id": 8, "full_name": "Montréal Canadiens", "abbreviation": "MTL"},
+    {"id": 9, "full_name": "Ottawa Senators", "abbreviation": "OTT"},
+    {"id": 10, "full_name": "Toronto Maple Leafs", "abbreviation": "TOR"},
+    {"id": 12, "full_name": "Carolina Hurricanes", "abbreviation": "CAR"},
+    {"id": 13, "full_name": "Florida Panthers", "abbreviation": "FLA"},
+    {"id": 14, "full_name": "Tampa Bay Lightning", "abbreviation": "TBL"},
+    {"id": 15, "full_name": "Washington Capitals", "abbreviation": "WSH"},
+    {"id": 16, "full_name": "Chicago Blackhawks", "abbreviation": "CHI"},
+    {"id": 17, "full_name": "Detroit Red Wings", "abbreviation": "DET"},
+    {"id": 18, "full_name": "Nashville Predators", "abbreviation": "NSH"},
+    {"id": 19, "full_name": "St. Louis Blues", "abbreviation": "STL"},
+    {"id": 20, "full_name": "Calgary Flames", "abbreviation": "CGY"},
+    {"id": 21, "full_name": "Colorado Avalanche", "abbreviation": "COL"},
+    {"id": 22, "full_name": "Edmonton Oilers", "abbreviation": "EDM"},
+    {"id": 23, "full_name": "Vancouver Canucks", "abbreviation": "VAN"},
+    {"id": 24, "full_name": "Anaheim Ducks", "abbreviation": "ANA"},
+    {"id": 25, "full_name": "Dallas Stars", "abbreviation": "DAL"},
+    {"id": 26, "full_name": "Los Angeles Kings", "abbreviation": "LAK"},
+    {"id": 28, "full_name": "San Jose Sharks", "abbreviation": "SJS"},
+    {"id": 29, "full_name": "Columbus Blue Jackets", "abbreviation": "CBJ"},
+    {"id": 30, "full_name": "Minnesota Wild", "abbreviation": "MIN"},
+    {"id": 52, "full_name": "Winnipeg Jets", "abbreviation": "WPG"},
+    {"id": 53, "full_name": "Utah Hockey Club", "abbreviation": "UTA"},
+    {"id": 54, "full_name": "Vegas Golden Knights", "abbreviation": "VGK"},
+    {"id": 55, "full_name": "Seattle Kraken", "abbreviation": "SEA"},
+]
+# Built once at import; the team list is static, so loaders share one frame and lookup map
+_NHL_TEAMS_DF = pd.DataFrame(_NHL_TEAMS)
+_NHL_TEAM_NAME_TO_ID = {team["full_name"]: team["id"] for team in _NHL_TEAMS}
+
+
 class NHLDataLoader(BaseDataLoader):
     """NHL-specific data loader implementation."""
 
@@ -20,7 +60,6 @@ class NHLDataLoader(BaseDataLoader):
         """Initialize NHL data loader."""
         # We'll use a simple approach with NHL's public API endpoints
         self.base_url = "https://api-web.nhle.com/v1"
-        self.teams_cache = None
         self.players_cache = None
 
     def list_active_players(self) -> pd.DataFrame:
@@ -42,50 +81,7 @@ class NHLDataLoader(BaseDataLoader):
 
     def list_active_teams(self) -> pd.DataFrame:
         """Return a DataFrame of NHL teams."""
-        try:
-            if self.teams_cache is not None:
-                return self.teams_cache
-
-            # Current NHL teams for 2023-24 season (32 teams)
-            teams_data = [
-                {"id": 1, "full_name": "New Jersey Devils", "abbreviation": "NJD"},
-                {"id": 2, "full_name": "New York Islanders", "abbreviation": "NYI"},
-                {"id": 3, "full_name": "New York Rangers", "abbreviation": "NYR"},
-                {"id": 4, "full_name": "Philadelphia Flyers", "abbreviation": "PHI"},
-                {"id": 5, "full_name": "Pittsburgh Penguins", "abbreviation": "PIT"},
-                {"id": 6, "full_name": "Boston Bruins", "abbreviation": "BOS"},
-                {"id": 7, "full_name": "Buffalo Sabres", "abbreviation": "BUF"},
-                {"id": 8, "full_name": "Montréal Canadiens", "abbreviation": "MTL"},
-                {"id": 9, "full_name": "Ottawa Senators", "abbreviation": "OTT"},
-                {"id": 10, "full_name": "Toronto Maple Leafs", "abbreviation": "TOR"},
-                {"id": 12, "full_name": "Carolina Hurricanes", "abbreviation": "CAR"},
-                {"id": 13, "full_name": "Florida Panthers", "abbreviation": "FLA"},
-                {"id": 14, "full_name": "Tampa Bay Lightning", "abbreviation": "TBL"},
-                {"id": 15, "full_name": "Washington Capitals", "abbreviation": "WSH"},
-                {"id": 16, "full_name": "Chicago Blackhawks", "abbreviation": "CHI"},
-                {"id": 17, "full_name": "Detroit Red Wings", "abbreviation": "DET"},
-                {"id": 18, "full_name": "Nashville Predators", "abbreviation": "NSH"},
-                {"id": 19, "full_name": "St. Louis Blues", "abbreviation": "STL"},
-                {"id": 20, "full_name": "Calgary Flames", "abbreviation": "CGY"},
-                {"id": 21, "full_name": "Colorado Avalanche", "abbreviation": "COL"},
-                {"id": 22, "full_name": "Edmonton Oilers", "abbreviation": "EDM"},
-                {"id": 23, "full_name": "Vancouver Canucks", "abbreviation": "VAN"},
-                {"id": 24, "full_name": "Anaheim Ducks", "abbreviation": "ANA"},
-                {"id": 25, "full_name": "Dallas Stars", "abbreviation": "DAL"},
-                {"id": 26, "full_name": "Los Angeles Kings", "abbreviation": "LAK"},
-                {"id": 28, "full_name": "San Jose Sharks", "abbreviation": "SJS"},
-                {"id": 29, "full_name": "Columbus Blue Jackets", "abbreviation": "CBJ"},
-                {"id": 30, "full_name": "Minnesota Wild", "abbreviation": "MIN"},
-                {"id": 52, "full_name": "Winnipeg Jets", "abbreviation": "WPG"},
-                {"id": 53, "full_name": "Utah Hockey Club", "abbreviation": "UTA"},
-                {"id": 54, "full_name": "Vegas Golden Knights", "abbreviation": "VGK"},
-                {"id": 55, "full_name": "Seattle Kraken", "abbreviation": "SEA"},
-            ]
-
-            self.teams_cache = pd.DataFrame(teams_data)
-            return self.teams_cache
-        except Exception:
-            return pd.DataFrame()
+        return _NHL_TEAMS_DF
 
     def get_player_id(self, player_name: str) -> Optional[int]:
         """Return the NHL player ID for a given full name."""
@@ -95,13 +91,7 @@ class NHLDataLoader(BaseDataLoader):
 
     def get_team_id(self, team_name: str) -> Optional[int]:
         """Return the NHL team ID for a given full name."""
-        teams_df = self.list_active_teams()
-        if teams_df.empty:
-            return None
-        matches = teams_df[teams_df["full_name"] == team_name]
-        if matches.empty:
-            return None
-        return int(matches.iloc[0]["id"])
+        return _NHL_TEAM_NAME_TO_ID.get(team_name)
 
     def load_player_game_log(
         self,
@@ -182,8 +172,11 @@ class NHLDataLoader(BaseDataLoader):
         }
 
     def _clean_game_log(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Standardize game log fields for downstream analytics."""
-        cleaned = data.copy()
+        """Standardize game log fields in place for downstream analytics.
+
+        The fetched frame is owned by the loader, so it is updated without a copy.
+        """
+        cleaned = data
 
         # Convert game date if present
         if "gameDate" in cleaned.columns:
@@ -194,8 +187,6 @@ class NHLDataLoader(BaseDataLoader):
 
         # Standardize numeric columns
         numeric_cols = ["goals", "assists", "points", "shots", "plusMinus", "timeOnIce"]
-        for col in numeric_cols:
-            if col in cleaned.columns:
-                cleaned[col] = pd.to_numeric(cleaned[col], errors="coerce")
+        self._coerce_numeric(cleaned, numeric_cols)
 
         return cleaned
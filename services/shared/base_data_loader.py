@@ -64,3 +64,11 @@ class BaseDataLoader(ABC):
     def get_stat_columns(self) -> dict[str, list[str]]:
         """Return sport-specific stat column mappings."""
         pass
+
+    @staticmethod
+    def _coerce_numeric(data: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
+        """Coerce the present ``cols`` of ``data`` to numbers in place with one block apply."""
+        present = [col for col in cols if col in data.columns]
+        if present:
+            data[present] = data[present].apply(pd.to_numeric, errors="coerce")
+        return data
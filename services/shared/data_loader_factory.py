@@ -10,22 +10,31 @@ from services.shared.base_data_loader import BaseDataLoader
 class DataLoaderFactory:
     """Factory for creating sport-specific data loaders."""
 
+    _LOADER_CLASSES: dict[str, type[BaseDataLoader]] = {
+        "NBA": NBADataLoader,
+        "NHL": NHLDataLoader,
+    }
+    # Loaders hold no per-call state, so one lazily built instance per sport is shared
+    _LOADER_INSTANCES: dict[str, BaseDataLoader] = {}
+
     @staticmethod
     def create_loader(sport: str) -> BaseDataLoader:
-        """Create a data loader for the specified sport.
+        """Return the data loader for the specified sport.
 
         Args:
             sport: Sport name (e.g., "NBA", "NHL")
 
         Returns:
-            Sport-specific data loader instance
+            Sport-specific data loader instance, shared across calls
 
         Raises:
             ValueError: If sport is not supported
         """
-        if sport == "NBA":
-            return NBADataLoader()
-        elif sport == "NHL":
-            return NHLDataLoader()
-        else:
-            raise ValueError(f"Unsupported sport: {sport}. Available sports: NBA, NHL")
+        loader = DataLoaderFactory._LOADER_INSTANCES.get(sport)
+        if loader is None:
+            loader_class = DataLoaderFactory._LOADER_CLASSES.get(sport)
+            if loader_class is None:
+                available = ", ".join(DataLoaderFactory._LOADER_CLASSES)
+                raise ValueError(f"Unsupported sport: {sport}. Available sports: {available}")
+            loader = DataLoaderFactory._LOADER_INSTANCES.setdefault(sport, loader_class())
+        return loader
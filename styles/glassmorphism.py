@@ -1,6 +1,9 @@
 """Modern CSS styles for Signal Sports Analytics."""
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=None)
 def get_glassmorphism_css(sport: str = "NBA") -> str:
     """Return glassmorphism CSS with sport-specific theming.
 
@@ -8,7 +11,7 @@ def get_glassmorphism_css(sport: str = "NBA") -> str:
         sport: Sport name (NBA or NHL) for color theming
 
     Returns:
-        CSS string with modern glassmorphism design
+        CSS string with modern glassmorphism design (built once per sport)
     """
     # Sport-specific colors
     if sport == "NHL":
@@ -125,6 +128,27 @@ def get_glassmorphism_css(sport: str = "NBA") -> str:
             opacity: 0.8;
         }}
 
+        .metric-value {{
+            color: {accent_color};
+            font-weight: 700;
+            font-size: 2rem;
+            text-shadow: 0 0 20px {accent_color}40;
+        }}
+
+        .metric-delta {{
+            color: #FF4B4B;
+            font-weight: 600;
+            font-size: 0.9rem;
+        }}
+
+        /* Metric Grid (a row of metric cards rendered as one element) */
+        .metric-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
+            gap: 1rem;
+            margin-bottom: 1rem;
+        }}
+
         /* Sidebar Styling */
         [data-testid="stSidebar"] {{
             background: linear-gradient(180deg, #1a1f2e 0%, #0E1117 100%);
@@ -2,44 +2,223 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Iterable
+import os
+import re
+import threading
+import time
+from collections.abc import Sized
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Iterable
 
 import numpy as np
 import pandas as pd
 
 
+# On-disk copies of fetched API frames, relative to the app's working directory
+FRAME_CACHE_DIR = Path(".cache") / "frames"
+
+# Day numbers count whole days since 1970-01-01, the epoch of time.time_ns()
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_NS_PER_DAY = 86_400_000_000_000
+
+
+# Season separators render as en dashes ("2023-24" -> "2023–24")
+_SEASON_TRANS = str.maketrans({"-": "–"})
+
+
 def format_season_label(season: str) -> str:
     """Return a friendly season label."""
-    return season.replace("-", "–")
+    return season.translate(_SEASON_TRANS)
+
+
+def format_season_labels(seasons: pd.Series) -> pd.Series:
+    """Vectorized ``format_season_label`` over a column of seasons."""
+    return seasons.astype("string").str.translate(_SEASON_TRANS)
+
+
+def ensure_datetime(series: pd.Series, format: str | None = None) -> pd.Series:
+    """Safely coerce a series into datetime values.
+
+    Passing a strptime ``format`` skips per-value format inference.
+    """
+    # Loaders already parse GAME_DATE, so datetime columns pass through untouched
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    # cache=True parses each distinct value once and maps the results back
+    return pd.to_datetime(series, errors="coerce", format=format, cache=True)
+
+
+def sort_by_date(data: pd.DataFrame, date_col: str = "GAME_DATE") -> pd.DataFrame:
+    """Return data in ascending date order, sorting only when it is not already ordered.
+
+    Newest-first logs, as the NBA API returns them, are reversed instead of sorted.
+    """
+    dates = data[date_col]
+    if dates.is_monotonic_increasing:
+        return data
+    if dates.is_monotonic_decreasing:
+        return data.iloc[::-1]
+    return data.sort_values(date_col, kind="stable")
+
+
+def compute_rolling_average(
+    series: pd.Series, window: int = 5, dtype: np.dtype | type = np.float64
+) -> pd.Series:
+    """Compute a rolling average with a minimum of one observation.
+
+    Sums accumulate in float64; ``dtype`` (e.g. ``np.float32`` for plotting)
+    only sets the precision of the returned values.
+    """
+    averages = rolling_mean(series.to_numpy(dtype="float64", na_value=np.nan), window)
+    return pd.Series(averages.astype(dtype, copy=False), index=series.index, name=series.name)
+
 
+def compute_rolling_averages(
+    df: pd.DataFrame, window: int = 5, columns: Iterable[str] | None = None
+) -> pd.DataFrame:
+    """Compute ``compute_rolling_average`` for several columns in one pass.
 
-def ensure_datetime(series: pd.Series) -> pd.Series:
-    """Safely coerce a series into datetime values."""
-    return pd.to_datetime(series, errors="coerce")
+    Defaults to every numeric column of ``df``.
+    """
+    cols = list(columns) if columns is not None else list(df.select_dtypes("number").columns)
+    values = df[cols].to_numpy(dtype="float64", na_value=np.nan)
+    return pd.DataFrame(rolling_mean(values, window), index=df.index, columns=cols)
 
 
-def compute_rolling_average(series: pd.Series, window: int = 5) -> pd.Series:
-    """Compute a rolling average with a minimum of one observation."""
-    return series.rolling(window=window, min_periods=1).mean()
+def rolling_mean(values: Iterable[float], window: int = 5) -> np.ndarray:
+    """Trailing mean over up to ``window`` non-NaN observations, via cumulative sums.
+
+    2-D input is averaged down each column.
+    """
+    values = np.asarray(values, dtype="float64")
+    valid = ~np.isnan(values)
+    sums = np.cumsum(np.where(valid, values, 0.0), axis=0)
+    counts = np.cumsum(valid, axis=0)
+    sums[window:] = sums[window:] - sums[:-window]
+    counts[window:] = counts[window:] - counts[:-window]
+    with np.errstate(invalid="ignore"):
+        return sums / counts
+
+
+def downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """Store float64 columns as float32 and int64 columns as int32 when values fit."""
+    int32 = np.iinfo(np.int32)
+    dtypes = {col: "float32" for col in df.select_dtypes("float64").columns}
+    for col in df.select_dtypes("int64").columns:
+        if df[col].empty or (df[col].min() >= int32.min and df[col].max() <= int32.max):
+            dtypes[col] = "int32"
+    return df.astype(dtypes) if dtypes else df
+
+
+def cached_frame(
+    key: str,
+    fetch: Callable[[], pd.DataFrame],
+    ttl_seconds: float = 3600,
+    force_refresh: bool = False,
+) -> pd.DataFrame:
+    """Return ``fetch()``, reusing a parquet copy on disk younger than ``ttl_seconds``.
+
+    ``force_refresh`` skips the disk copy and overwrites it with a fresh fetch.
+    """
+    path = FRAME_CACHE_DIR / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', key)}.parquet"
+    try:
+        if not force_refresh and time.time() - path.stat().st_mtime < ttl_seconds:
+            return pd.read_parquet(path)
+    except Exception:
+        pass  # Missing or unreadable copy; fetch a fresh one
+
+    data = fetch()
+    if not data.empty:
+        # Write to a private temp file and swap it in so readers never see a partial file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data.to_parquet(tmp_path, index=False, compression="zstd")
+            tmp_path.replace(path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+    return data
 
 
 def clamp(value: float, lower: float = 0.0, upper: float = 100.0) -> float:
     """Clamp a numeric value between a lower and upper bound."""
-    return float(max(lower, min(value, upper)))
+    # NaN compares false both ways; clamp it to the lower bound as min/max did
+    if value != value:
+        return float(lower)
+    result = lower if value < lower else upper if value > upper else value
+    # Only box through float() when the chosen operand is not already a float
+    return result if type(result) is float else float(result)
+
+
+def clamp_array(values: np.ndarray, lower: float = 0.0, upper: float = 100.0) -> np.ndarray:
+    """Vectorized ``clamp``; writable float arrays are clipped in place."""
+    values = np.asarray(values)
+    if values.dtype.kind != "f" or not values.flags.writeable:
+        values = values.astype("float64")
+    # np.clip lets NaN through; map it to the lower bound as the scalar clamp does
+    np.copyto(values, lower, where=np.isnan(values))
+    return np.clip(values, lower, upper, out=values)
 
 
 def safe_mean(values: Iterable[float]) -> float:
     """Return the mean of values, falling back to 0.0 when empty."""
-    values = list(values)
-    if not values:
+    # Arrays and Series already hold a buffer; only one-shot iterables need filling
+    if isinstance(values, pd.Series):
+        values = values.to_numpy(dtype="float64", na_value=np.nan)
+    elif isinstance(values, np.ndarray):
+        values = np.asarray(values, dtype="float64").ravel()
+    elif isinstance(values, Sized):
+        # Sized containers know their length: empty ones return before any allocation
+        # and the rest fill an exactly preallocated buffer
+        if not len(values):
+            return 0.0
+        values = np.fromiter(values, dtype="float64", count=len(values))
+    else:
+        values = np.fromiter(values, dtype="float64")
+    if not values.size:
         return 0.0
-    return float(np.nanmean(values))
+    valid = ~np.isnan(values)
+    count = np.count_nonzero(valid)
+    if not count:
+        return float("nan")
+    # A masked reduction sums the buffer in place, where nanmean copies it to zero out NaNs
+    return float(np.add.reduce(values, where=valid) / count)
+
+
+def safe_group_means(values: np.ndarray, group_starts: np.ndarray) -> np.ndarray:
+    """Return ``safe_mean`` of each contiguous group of values in one vectorized pass.
+
+    ``group_starts`` holds the strictly increasing start offset of every group.
+    """
+    values = np.asarray(values, dtype="float64")
+    group_starts = np.asarray(group_starts, dtype=np.intp)
+    if not values.size or not group_starts.size:
+        return np.empty(0, dtype="float64")
+    valid = ~np.isnan(values)
+    # Zero-fill NaNs in a temporary so the caller's buffer is left untouched
+    sums = np.add.reduceat(np.where(valid, values, 0.0), group_starts)
+    counts = np.add.reduceat(valid, group_starts, dtype=np.intp)
+    with np.errstate(invalid="ignore"):
+        return sums / counts
+
+
+def _utc_day_number() -> int:
+    """Return today's UTC date as a day number, using integer math on the wall clock."""
+    return time.time_ns() // _NS_PER_DAY
 
 
 def days_since(date_value: datetime) -> int:
     """Compute days since a provided datetime value."""
-    if pd.isna(date_value):
+    # NaT and NaN are the only values unequal to themselves, so this skips pd.isna dispatch
+    if date_value is None or date_value != date_value:
         return 0
-    delta = datetime.utcnow().date() - date_value.date()
-    return max(delta.days, 0)
+    return max(_utc_day_number() - (date_value.toordinal() - _EPOCH_ORDINAL), 0)
+
+
+def days_since_array(values: Iterable[datetime]) -> np.ndarray:
+    """Vectorized ``days_since`` over a column of dates; missing dates count as 0 days."""
+    dates = np.asarray(pd.to_datetime(values, errors="coerce"), dtype="datetime64[D]")
+    elapsed = (np.datetime64(_utc_day_number(), "D") - dates).astype("int64")
+    # NaT differences come out as the minimum int64, so the floor at zero also covers them
+    return np.maximum(elapsed, 0, out=elapsed)